@@ -3,15 +3,23 @@ Deadline checker module.
 Filters conferences with upcoming deadlines.
 """
 
-from datetime import datetime
+import operator
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any
-from zoneinfo import ZoneInfo
 
 from parser import Conference, ConferenceParser
 
+# C-level singleton, avoids ZoneInfo lookup in the per-call paths
+_UTC = timezone.utc
+
 
 SUBMISSION_TYPES = {'abstract', 'paper', 'submission'}
 
+DATETIME_FORMAT = '%Y-%m-%d %H:%M %Z'
+
+# C-level sort key; built once instead of per get_upcoming_deadlines call
+_MIN_DAYS_KEY = operator.itemgetter('min_days_until')
+
 
 class DeadlineChecker:
     """Checks for upcoming conference deadlines."""
@@ -35,9 +43,20 @@ class DeadlineChecker:
             List of dictionaries containing conference and deadline information
         """
         upcoming = []
+        now = datetime.now(_UTC)
+        # +1 day keeps the guard conservative: days_until truncates
+        # partial days, so a deadline just past now + days still counts
+        cutoff = now + timedelta(days=days + 1)
 
         for conf in self.conferences:
-            conf_deadlines = conf.get_upcoming_deadlines(days)
+            # Skip conferences whose deadlines all fall outside the window
+            # using the min/max cached at parse time
+            if (conf.min_deadline_utc is None
+                    or conf.min_deadline_utc > cutoff
+                    or conf.max_deadline_utc < now):
+                continue
+
+            conf_deadlines = conf.get_upcoming_deadlines(days, now=now)
 
             has_submission = any(
                 self._is_submission_deadline(dl['type']) for dl in conf_deadlines
@@ -46,10 +65,12 @@ class DeadlineChecker:
                 upcoming.append({
                     'conference': conf,
                     'deadlines': conf_deadlines,
+                    'min_days_until': min(dl['days_until'] for dl in conf_deadlines),
                 })
 
-        # Sort by nearest deadline
-        upcoming.sort(key=lambda x: min(dl['days_until'] for dl in x['deadlines']))
+        # Sort by nearest deadline; the min is computed once per entry
+        # above instead of on every comparison
+        upcoming.sort(key=_MIN_DAYS_KEY)
 
         return upcoming
 
@@ -73,26 +94,27 @@ class DeadlineChecker:
             conf = item['conference']
             deadlines = item['deadlines']
 
-            summary.append(f"\n{conf.full_name} ({conf.year})")
-            summary.append(f"  Location: {conf.place}")
-            summary.append(f"  Conference: {conf.date_str}")
-            summary.append(f"  Link: {conf.link}")
+            summary.extend((
+                f"\n{conf.full_name} ({conf.year})",
+                f"  Location: {conf.place}",
+                f"  Conference: {conf.date_str}",
+                f"  Link: {conf.link}",
+            ))
 
             if conf.tags:
                 summary.append(f"  Tags: {', '.join(str(t) for t in conf.tags)}")
 
             summary.append("  Deadlines:")
             for dl in deadlines:
-                dt = dl['datetime']
                 days = dl['days_until']
                 dl_type = dl['type'].replace('_', ' ').title()
 
                 # Format deadline in local timezone
-                local_tz = ZoneInfo('UTC')  # Can be configured per user
-                dt_local = dt.astimezone(local_tz)
+                local_tz = _UTC  # Can be configured per user
+                dt_local = dl['datetime'].astimezone(local_tz)
 
                 days_str = f"in {days} day{'s' if days != 1 else ''}" if days > 0 else "TODAY"
-                summary.append(f"    - {dl_type}: {dt_local.strftime('%Y-%m-%d %H:%M %Z')} ({days_str})")
+                summary.append(f"    - {dl_type}: {dt_local.strftime(DATETIME_FORMAT)} ({days_str})")
 
             if conf.comment:
                 summary.append(f"  Note: {conf.comment}")
@@ -4,16 +4,51 @@ Sends formatted conference deadline reminders.
 """
 
 import os
+import tempfile
 from typing import List, Dict, Any
 from pathlib import Path
-from jinja2 import Template
-import resend
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, TemplateNotFound
+import requests
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M %Z'
+
+RESEND_API_URL = 'https://api.resend.com/emails'
+
+_TEMPLATES_DIR = (Path(__file__).parent.parent / 'templates').resolve()
+
+# Shared environment: compiled templates are cached for the process
+# lifetime and the bytecode cache persists them across the weekly runs
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader([_TEMPLATES_DIR]),
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache(tempfile.gettempdir()),
+)
+
+
+def _decorate_deadlines(upcoming_deadlines: List[Dict[str, Any]]) -> None:
+    """Precompute display strings shared by the HTML and text bodies.
+
+    Every renderer needs the same formatted datetime and "in N days"
+    string per deadline, so build them once instead of per body.
+    """
+    for item in upcoming_deadlines:
+        for dl in item['deadlines']:
+            days = dl['days_until']
+            dl['datetime_formatted'] = dl['datetime'].strftime(DATETIME_FORMAT)
+            dl['days_str'] = f"in {days} day{'s' if days != 1 else ''}" if days > 0 else "TODAY"
 
 
 class EmailSender:
     """Sends conference deadline reminder emails using Resend."""
 
-    def __init__(self, api_key: str, from_email: str, from_name: str = "Conference Deadline Bot"):
+    def __init__(
+        self,
+        api_key: str,
+        from_email: str,
+        from_name: str = "Conference Deadline Bot",
+        template_path: str = 'templates/email_template.html'
+    ):
         """
         Initialize email sender.
 
@@ -21,17 +56,38 @@ class EmailSender:
             api_key: Resend API key
             from_email: Sender email address (must be verified domain in Resend)
             from_name: Sender name to display
+            template_path: Path to HTML email template
         """
         self.api_key = api_key
         self.from_email = from_email
         self.from_name = from_name
-        resend.api_key = api_key
+        # Resolve the template once at construction; every send then
+        # renders the preloaded template without a stat/open per call
+        path = Path(template_path)
+        try:
+            if path.resolve().parent == _TEMPLATES_DIR:
+                # Repo template: served by the shared environment with
+                # its compiled-template and bytecode caches
+                self.template = _JINJA_ENV.get_template(path.name)
+            else:
+                # Caller-supplied template outside templates/: compile
+                # it once from the file so arbitrary paths keep working
+                self.template = _JINJA_ENV.from_string(path.read_text(encoding='utf-8'))
+        except (TemplateNotFound, OSError):
+            self.template = None
+        # A Session keeps the TCP+TLS connection to the Resend API alive
+        # across sends, and scopes the API key to this sender instead of
+        # the resend module global
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json',
+        })
 
     def send_deadline_reminder(
         self,
         to_email: str,
         upcoming_deadlines: List[Dict[str, Any]],
-        template_path: str = 'templates/email_template.html'
     ) -> Dict[str, Any]:
         """
         Send email with upcoming conference deadlines.
@@ -39,7 +95,6 @@ class EmailSender:
         Args:
             to_email: Recipient email address
             upcoming_deadlines: List of upcoming deadline dictionaries
-            template_path: Path to HTML email template
 
         Returns:
             Response from Resend API
@@ -48,8 +103,11 @@ class EmailSender:
             print("No upcoming deadlines to send.")
             return {'status': 'skipped', 'reason': 'no_deadlines'}
 
-        # Load and render HTML template
-        html_content = self._render_template(template_path, upcoming_deadlines)
+        # Precompute display strings shared by both bodies
+        _decorate_deadlines(upcoming_deadlines)
+
+        # Render HTML template
+        html_content = self._render_template(upcoming_deadlines)
 
         # Generate plain text version
         text_content = self._generate_text_content(upcoming_deadlines)
@@ -67,27 +125,24 @@ class EmailSender:
                 "text": text_content,
             }
 
-            response = resend.Emails.send(params)
+            response = self.session.post(RESEND_API_URL, json=params, timeout=30)
+            response.raise_for_status()
+            result = response.json()
             print(f"Email sent successfully to {to_email}")
-            print(f"Response: {response}")
-            return response
+            print(f"Response: {result}")
+            return result
 
         except Exception as e:
             print(f"Error sending email: {e}")
             return {'status': 'error', 'error': str(e)}
 
-    def _render_template(self, template_path: str, upcoming_deadlines: List[Dict[str, Any]]) -> str:
+    def _render_template(self, upcoming_deadlines: List[Dict[str, Any]]) -> str:
         """Render HTML email template with conference data."""
-        template_file = Path(template_path)
-
-        if not template_file.exists():
+        if self.template is None:
             # Fallback to simple HTML if template not found
             return self._generate_simple_html(upcoming_deadlines)
 
-        with open(template_file, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-
-        template = Template(template_content)
+        template = self.template
 
         # Format deadlines for template
         formatted_conferences = []
@@ -98,7 +153,7 @@ class EmailSender:
             for dl in item['deadlines']:
                 dl_formatted = {
                     'type': dl['type'],
-                    'datetime_formatted': dl['datetime'].strftime('%Y-%m-%d %H:%M %Z'),
+                    'datetime_formatted': dl['datetime_formatted'],
                     'days_until': dl['days_until'],
                 }
                 deadlines.append(dl_formatted)
@@ -126,17 +181,17 @@ class EmailSender:
 
         for item in upcoming_deadlines:
             conf = item['conference']
-            html_parts.append(f'<h2>{conf.full_name} ({conf.year})</h2>')
-            html_parts.append(f'<p><strong>Location:</strong> {conf.place}</p>')
-            html_parts.append(f'<p><strong>Conference:</strong> {conf.date_str}</p>')
-            html_parts.append(f'<p><strong>Link:</strong> <a href="{conf.link}">{conf.link}</a></p>')
-
-            html_parts.append('<ul>')
+            html_parts.extend((
+                f'<h2>{conf.full_name} ({conf.year})</h2>',
+                f'<p><strong>Location:</strong> {conf.place}</p>',
+                f'<p><strong>Conference:</strong> {conf.date_str}</p>',
+                f'<p><strong>Link:</strong> <a href="{conf.link}">{conf.link}</a></p>',
+                '<ul>',
+            ))
             for dl in item['deadlines']:
-                dt_str = dl['datetime'].strftime('%Y-%m-%d %H:%M %Z')
-                days = dl['days_until']
-                days_str = f"in {days} day{'s' if days != 1 else ''}" if days > 0 else "TODAY"
-                html_parts.append(f'<li><strong>{dl["type"]}:</strong> {dt_str} ({days_str})</li>')
+                html_parts.append(
+                    f'<li><strong>{dl["type"]}:</strong> {dl["datetime_formatted"]} ({dl["days_str"]})</li>'
+                )
             html_parts.append('</ul>')
 
         html_parts.append('</body></html>')
@@ -152,21 +207,20 @@ class EmailSender:
 
         for item in upcoming_deadlines:
             conf = item['conference']
-            text_parts.append(f'\n{conf.full_name} ({conf.year})')
-            text_parts.append(f'Location: {conf.place}')
-            text_parts.append(f'Conference: {conf.date_str}')
-            text_parts.append(f'Link: {conf.link}')
+            text_parts.extend((
+                f'\n{conf.full_name} ({conf.year})',
+                f'Location: {conf.place}',
+                f'Conference: {conf.date_str}',
+                f'Link: {conf.link}',
+            ))
 
             if conf.tags:
                 text_parts.append(f'Tags: {", ".join(str(t) for t in conf.tags)}')
 
             text_parts.append('\nUpcoming Deadlines:')
             for dl in item['deadlines']:
-                dt_str = dl['datetime'].strftime('%Y-%m-%d %H:%M %Z')
-                days = dl['days_until']
-                days_str = f"in {days} day{'s' if days != 1 else ''}" if days > 0 else "TODAY"
                 dl_type = dl['type'].replace('_', ' ').title()
-                text_parts.append(f'  - {dl_type}: {dt_str} ({days_str})')
+                text_parts.append(f'  - {dl_type}: {dl["datetime_formatted"]} ({dl["days_str"]})')
 
             if conf.comment:
                 text_parts.append(f'Note: {conf.comment}')
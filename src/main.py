@@ -91,7 +91,7 @@ def main():
     print(f"\n📋 Summary:")
     for item in upcoming[:5]:  # Show first 5
         conf = item['conference']
-        min_days = min(dl['days_until'] for dl in item['deadlines'])
+        min_days = item['min_days_until']
         print(f"  • {conf.name} {conf.year} - nearest deadline in {min_days} day(s)")
 
     if len(upcoming) > 5:
@@ -102,13 +102,13 @@ def main():
     sender = EmailSender(
         config['resend_api_key'],
         config['from_email'],
-        config['from_name']
+        config['from_name'],
+        template_path=str(template_path)
     )
 
     result = sender.send_deadline_reminder(
         config['to_email'],
-        upcoming,
-        str(template_path)
+        upcoming
     )
 
     if result.get('status') == 'error':
@@ -3,53 +3,138 @@ Conference data parser module.
 Parses YAML files containing AI and security conference deadlines.
 """
 
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Iterator, List, Dict, Any, Optional
 from pathlib import Path
+import re
 import yaml
 from zoneinfo import ZoneInfo
 
+try:
+    # libyaml C loader is ~10x faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-class Conference:
-    """Represents a conference with its deadlines and metadata."""
+# timezone.utc is a C-level singleton — cheaper than ZoneInfo('UTC')
+# as a comparison/conversion target
+_UTC = timezone.utc
+
+# Matches UTC offset formats (UTC-12, UTC+2, ...)
+_TZ_OFFSET_RE = re.compile(r'^UTC([+-]\d{1,2})$')
+
+# Prebuilt zones for the strings that dominate the data files;
+# AoE (Anywhere on Earth) = UTC-12
+_TZ_FAST = {
+    'AOE': ZoneInfo('Etc/GMT+12'),
+    'UTC': _UTC,
+    'UTC-12': ZoneInfo('Etc/GMT+12'),
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_timezone(tz_str: str) -> Optional[tzinfo]:
+    """Parse timezone string to ZoneInfo object.
+
+    Cached at module level: YAML files repeat the same handful of timezone
+    strings ('AoE', 'UTC-12', ...) across hundreds of deadlines, and
+    ZoneInfo instances are immutable so sharing them is safe.
+    """
+    if not tz_str:
+        return _UTC
+
+    key = tz_str.strip().upper()
+
+    # Fast path: single dict hit for the common strings
+    tz = _TZ_FAST.get(key)
+    if tz is not None:
+        return tz
+
+    # UTC offset format
+    match = _TZ_OFFSET_RE.match(key)
+    if match:
+        # GMT zones are inverted: GMT+12 = UTC-12
+        return ZoneInfo(f'Etc/GMT{-int(match.group(1)):+d}')
 
-    def __init__(self, data: Dict[str, Any], source: str):
-        self.source = source  # 'ai' or 'security'
+    # Try as IANA timezone name
+    try:
+        return ZoneInfo(tz_str.strip())
+    except Exception:
+        return _UTC
 
+
+@dataclass(slots=True)
+class Conference:
+    """Represents a conference with its deadlines and metadata.
+
+    Slotted to keep per-instance memory small; construct from raw YAML
+    data with `Conference.from_yaml`.
+    """
+
+    source: str  # 'ai' or 'security'
+    name: str
+    year: Optional[int]
+    full_name: str
+    link: str
+    city: str
+    country: str
+    place: str
+    date_str: str
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+    tags: List[Any]
+    hindex: Optional[int]
+    comment: str
+    deadlines: List[Dict[str, Any]]
+    # Earliest/latest deadline in UTC, cached so the checker can skip
+    # whole conferences with a single comparison
+    min_deadline_utc: Optional[datetime]
+    max_deadline_utc: Optional[datetime]
+
+    @classmethod
+    def from_yaml(cls, data: Dict[str, Any], source: str) -> 'Conference':
+        """Build a Conference from a parsed YAML record."""
         # Handle different field names between AI and security conferences
-        self.name = data.get('title') or data.get('name', 'Unknown')
-        self.year = data.get('year')
-        self.full_name = data.get('full_name', self.name)
-        self.link = data.get('link', '')
-
-        # Location info
-        self.city = data.get('city', '')
-        self.country = data.get('country', '')
-        self.place = data.get('place', f"{self.city}, {self.country}".strip(', '))
-
-        # Conference dates
-        self.date_str = data.get('date', '')
-        self.start_date = self._parse_date(data.get('start'))
-        self.end_date = self._parse_date(data.get('end'))
-
-        # Additional metadata
-        self.tags = data.get('tags', [])
-        self.hindex = data.get('hindex')
-        self.comment = data.get('comment', '')
-
-        # Parse deadlines
-        self.deadlines = self._parse_deadlines(data)
-
-    def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
+        name = data.get('title') or data.get('name', 'Unknown')
+        city = data.get('city', '')
+        country = data.get('country', '')
+        deadlines = cls._parse_deadlines(data)
+
+        return cls(
+            source=source,
+            name=name,
+            year=data.get('year'),
+            full_name=data.get('full_name', name),
+            link=data.get('link', ''),
+            city=city,
+            country=country,
+            place=data.get('place', f"{city}, {country}".strip(', ')),
+            date_str=data.get('date', ''),
+            start_date=cls._parse_date(data.get('start')),
+            end_date=cls._parse_date(data.get('end')),
+            tags=data.get('tags', []),
+            hindex=data.get('hindex'),
+            comment=data.get('comment', ''),
+            deadlines=deadlines,
+            min_deadline_utc=min((dl['datetime_utc'] for dl in deadlines), default=None),
+            max_deadline_utc=max((dl['datetime_utc'] for dl in deadlines), default=None),
+        )
+
+    @staticmethod
+    def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
         """Parse date string to datetime object."""
         if not date_str:
             return None
         try:
-            return datetime.strptime(date_str, '%Y-%m-%d')
+            return datetime.fromisoformat(date_str)
         except (ValueError, TypeError):
             return None
 
-    def _parse_deadlines(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @classmethod
+    def _parse_deadlines(cls, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Parse deadline information from conference data."""
         deadlines = []
 
@@ -61,11 +146,13 @@ class Conference:
                     'date_str': dl.get('date', ''),
                     'timezone': dl.get('timezone', data.get('timezone', 'UTC-12')),
                 }
-                deadline_info['datetime'] = self._parse_deadline_datetime(
+                dt = cls._parse_deadline_datetime(
                     deadline_info['date_str'],
                     deadline_info['timezone']
                 )
-                if deadline_info['datetime']:
+                if dt:
+                    deadline_info['datetime'] = dt
+                    deadline_info['datetime_utc'] = dt.astimezone(_UTC)
                     deadlines.append(deadline_info)
 
         # Check for single deadline format
@@ -81,8 +168,10 @@ class Conference:
                         'date_str': dl_str,
                         'timezone': timezone,
                     }
-                    deadline_info['datetime'] = self._parse_deadline_datetime(dl_str, timezone)
-                    if deadline_info['datetime']:
+                    dt = cls._parse_deadline_datetime(dl_str, timezone)
+                    if dt:
+                        deadline_info['datetime'] = dt
+                        deadline_info['datetime_utc'] = dt.astimezone(_UTC)
                         deadlines.append(deadline_info)
 
             # Handle single deadline string
@@ -92,31 +181,30 @@ class Conference:
                     'date_str': deadline_value,
                     'timezone': timezone,
                 }
-                deadline_info['datetime'] = self._parse_deadline_datetime(deadline_value, timezone)
-                if deadline_info['datetime']:
+                dt = cls._parse_deadline_datetime(deadline_value, timezone)
+                if dt:
+                    deadline_info['datetime'] = dt
+                    deadline_info['datetime_utc'] = dt.astimezone(_UTC)
                     deadlines.append(deadline_info)
 
         return deadlines
 
-    def _parse_deadline_datetime(self, date_str: str, timezone_str: str) -> Optional[datetime]:
+    @staticmethod
+    def _parse_deadline_datetime(date_str: str, timezone_str: str) -> Optional[datetime]:
         """Parse deadline string with timezone to datetime object."""
         if not date_str:
             return None
 
         try:
-            # Handle different date formats
-            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M']:
-                try:
-                    dt = datetime.strptime(date_str, fmt)
-                    break
-                except ValueError:
-                    continue
-            else:
-                # If no format matched, return None
+            # fromisoformat is C-accelerated and handles both the
+            # 'YYYY-MM-DD HH:MM:SS' and 'YYYY-MM-DD HH:MM' formats
+            try:
+                dt = datetime.fromisoformat(date_str.replace(' ', 'T', 1))
+            except ValueError:
                 return None
 
             # Parse timezone
-            tz = self._parse_timezone(timezone_str)
+            tz = _parse_timezone(timezone_str)
             if tz:
                 dt = dt.replace(tzinfo=tz)
 
@@ -124,49 +212,33 @@ class Conference:
         except (ValueError, TypeError):
             return None
 
-    def _parse_timezone(self, tz_str: str) -> Optional[ZoneInfo]:
+    @staticmethod
+    def _parse_timezone(tz_str: str) -> Optional[tzinfo]:
         """Parse timezone string to ZoneInfo object."""
-        if not tz_str:
-            return ZoneInfo('UTC')
-
-        # Handle common timezone formats
-        tz_str = tz_str.strip()
-
-        # AoE (Anywhere on Earth) = UTC-12
-        if tz_str.upper() == 'AOE':
-            return ZoneInfo('Etc/GMT+12')
-
-        # Handle UTC offset format (UTC-12, UTC+2, etc.)
-        if tz_str.upper().startswith('UTC'):
-            offset_str = tz_str[3:]
-            if offset_str:
-                try:
-                    offset = int(offset_str)
-                    # GMT zones are inverted: GMT+12 = UTC-12
-                    return ZoneInfo(f'Etc/GMT{-offset:+d}')
-                except ValueError:
-                    pass
-
-        # Try as IANA timezone name
-        try:
-            return ZoneInfo(tz_str)
-        except Exception:
-            return ZoneInfo('UTC')
+        return _parse_timezone(tz_str)
+
+    def get_upcoming_deadlines(self, days: int = 60, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Get deadlines within the next N days.
 
-    def get_upcoming_deadlines(self, days: int = 60) -> List[Dict[str, Any]]:
-        """Get deadlines within the next N days."""
-        now = datetime.now(ZoneInfo('UTC'))
+        Callers iterating many conferences can pass a shared `now` to avoid
+        re-reading the clock per conference.
+        """
+        if now is None:
+            now = datetime.now(_UTC)
         upcoming = []
 
         for deadline in self.deadlines:
             if deadline['datetime']:
-                # Convert to UTC for comparison
-                dl_utc = deadline['datetime'].astimezone(ZoneInfo('UTC'))
-                days_until = (dl_utc - now).days
+                # UTC value is precomputed at parse time
+                days_until = (deadline['datetime_utc'] - now).days
 
                 if 0 <= days_until <= days:
+                    # Carry only the fields downstream consumers use
+                    # instead of copying the whole deadline dict
                     upcoming.append({
-                        **deadline,
+                        'type': deadline['type'],
+                        'datetime': deadline['datetime'],
+                        'datetime_utc': deadline['datetime_utc'],
                         'days_until': days_until,
                     })
 
@@ -187,37 +259,42 @@ class ConferenceParser:
         """Parse all conference files and return list of Conference objects."""
         conferences = []
 
-        # Parse AI conferences
-        if self.ai_file.exists():
-            conferences.extend(self._parse_file(self.ai_file, 'ai'))
+        # Parse the two files concurrently; libyaml releases the GIL so
+        # I/O and parsing of the AI and security files overlap.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = []
+            if self.ai_file.exists():
+                futures.append(executor.submit(list, self._parse_file(self.ai_file, 'ai')))
+            if self.security_file.exists():
+                futures.append(executor.submit(list, self._parse_file(self.security_file, 'security')))
 
-        # Parse security conferences
-        if self.security_file.exists():
-            conferences.extend(self._parse_file(self.security_file, 'security'))
+            for future in futures:
+                conferences.extend(future.result())
 
         return conferences
 
-    def _parse_file(self, file_path: Path, source: str) -> List[Conference]:
-        """Parse a single YAML file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-
-            if not data:
-                return []
+    def _parse_file(self, file_path: Path, source: str) -> Iterator[Conference]:
+        """Parse a single YAML file, yielding conferences as they are read.
 
-            # Handle both list and dict formats
-            if isinstance(data, list):
-                conferences = [Conference(item, source) for item in data]
-            elif isinstance(data, dict):
-                conferences = [Conference(data, source)]
-            else:
-                conferences = []
-
-            return conferences
+        load_all streams multi-document files one document at a time, so
+        peak memory stays at one document plus the Conference objects
+        instead of the whole raw tree.
+        """
+        try:
+            # Read bytes and let the loader handle UTF-8 decoding
+            with open(file_path, 'rb') as f:
+                for doc in yaml.load_all(f, Loader=_YamlLoader):
+                    if not doc:
+                        continue
+
+                    # Handle both list and dict formats
+                    if isinstance(doc, list):
+                        for item in doc:
+                            yield Conference.from_yaml(item, source)
+                    elif isinstance(doc, dict):
+                        yield Conference.from_yaml(doc, source)
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
-            return []
 
 
 if __name__ == '__main__':
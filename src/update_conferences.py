@@ -2,12 +2,40 @@
 Script to fetch and update conference data from upstream sources.
 """
 
+import asyncio
+import gzip
+import hashlib
+import json
+import multiprocessing
 import os
 import sys
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-import requests
-import yaml
+
+# httpx, requests, and yaml are imported lazily inside the functions
+# that need them; together they add ~100ms of cold-start that importing
+# this module (e.g. from tests) should not pay
+
+try:
+    # orjson parses/serializes several times faster than stdlib json
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        # Passthrough makes date/datetime raise TypeError like stdlib
+        # json; the YAML caches rely on that to skip documents whose
+        # bare dates would not round-trip through JSON
+        return orjson.dumps(obj, option=orjson.OPT_PASSTHROUGH_DATETIME)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
 
 # Configure logging
 logging.basicConfig(
@@ -32,9 +60,89 @@ AI_CONFERENCE_NAMES = [
     'rss', 'sgp', 'siggraph', 'uai', 'wacv', 'wsdm', 'www'
 ]
 
+# URLs precomputed once at import instead of formatted per fetch
+AI_CONFERENCE_URLS = tuple(
+    f"{AI_CONFERENCES_BASE_URL}/{name}.yml" for name in AI_CONFERENCE_NAMES
+)
+
 # Data directory
 DATA_DIR = Path(__file__).parent.parent / 'data'
 
+# Log banner, built once
+_BANNER = '=' * 60
+
+# Conditional-GET cache: {conf_name: {'etag', 'last_modified', 'text'}}.
+# GitHub raw answers 304 Not Modified for unchanged files, so most runs
+# skip both the download and the re-parse. The raw YAML text is cached
+# (not the parsed tree, which may contain non-JSON types like dates).
+# Gzipped: the cache holds every conference's YAML text, and compression
+# shrinks it ~6-10x. The data/*.yml outputs themselves stay uncompressed
+# because parser.py and the git workflow read and diff them directly.
+HTTP_CACHE_FILE = DATA_DIR / '.http_cache.json.gz'
+
+# Content-hash-keyed sidecar cache of parsed YAML documents; JSON parses
+# roughly an order of magnitude faster than YAML
+YAML_CACHE_DIR = DATA_DIR / '.yaml_cache'
+YAML_CACHE_LIMIT = 100
+
+# Shared session, built on first use by _get_session()
+_session = None
+
+_dns_cache_installed = False
+
+
+def _enable_dns_cache() -> None:
+    """Cache DNS lookups for the lifetime of the run.
+
+    Both upstreams live on one or two hosts, but every fresh connection
+    re-resolves them; an lru_cache around socket.getaddrinfo answers the
+    repeats locally. Only safe for a short-lived script like this one,
+    where records going stale mid-run is not a concern.
+    """
+    global _dns_cache_installed
+    if _dns_cache_installed:
+        return
+
+    import socket
+    from functools import lru_cache
+
+    socket.getaddrinfo = lru_cache(maxsize=32)(socket.getaddrinfo)
+    _dns_cache_installed = True
+
+
+def _get_session():
+    """Return the shared pooled session, creating it on first use.
+
+    The session reuses the pooled HTTPS connection instead of
+    handshaking per URL, and retries transient 5xx responses.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _session = requests.Session()
+        _session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]),
+        ))
+    return _session
+
+
+def _import_yaml():
+    """Import PyYAML lazily, preferring the libyaml loader and dumper.
+
+    The C implementations are 5-10x faster than the pure-Python ones.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
 
 def fetch_conference_data(url: str) -> dict:
     """
@@ -50,12 +158,15 @@ def fetch_conference_data(url: str) -> dict:
         requests.RequestException: If fetch fails
         yaml.YAMLError: If YAML parsing fails
     """
-    logger.info(f"Fetching data from {url}")
-    response = requests.get(url, timeout=30)
+    logger.info("Fetching data from %s", url)
+    response = _get_session().get(url, timeout=30)
     response.raise_for_status()
 
-    data = yaml.safe_load(response.text)
-    logger.info(f"Successfully fetched and parsed data ({len(response.text)} bytes)")
+    # Feed the raw bytes to the parser; libyaml decodes UTF-8 itself, so
+    # this skips building an intermediate str copy of the whole body
+    body = response.content
+    data = parse_yaml_cached(body)
+    logger.info("Successfully fetched and parsed data (%d bytes)", len(body))
     return data
 
 
@@ -71,25 +182,24 @@ def validate_conference_data(data: dict, filename: str) -> bool:
         True if valid, False otherwise
     """
     if not isinstance(data, list):
-        logger.error(f"Expected list of conferences, got {type(data)}")
+        logger.error("Expected list of conferences, got %s", type(data))
         return False
 
     if len(data) == 0:
         logger.error("Conference list is empty")
         return False
 
-    # Check that first few items have expected fields
-    required_fields = {'name', 'deadline'}
-    for i, conf in enumerate(data[:3]):  # Check first 3 conferences
-        if not isinstance(conf, dict):
-            logger.error(f"Conference {i} is not a dictionary")
-            return False
+    # Full-list structural check; isinstance and key membership run at
+    # C speed, so covering every entry costs almost nothing
+    if not all(isinstance(conf, dict) for conf in data):
+        logger.error("Conference list contains non-dictionary entries")
+        return False
 
-        missing_fields = required_fields - set(conf.keys())
-        if missing_fields:
-            logger.warning(f"Conference {i} missing fields: {missing_fields}")
+    missing = sum(1 for conf in data if 'name' not in conf or 'deadline' not in conf)
+    if missing:
+        logger.warning("%d conferences missing expected fields (name/deadline)", missing)
 
-    logger.info(f"Validation passed: {len(data)} conferences found")
+    logger.info("Validation passed: %d conferences found", len(data))
     return True
 
 
@@ -104,79 +214,284 @@ def save_conference_data(data: dict, filename: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    yaml, _, yaml_dumper = _import_yaml()
+
     filepath = DATA_DIR / filename
+    tmp_path = filepath.with_suffix('.yml.tmp')
 
     try:
-        # Create backup of existing file
-        if filepath.exists():
-            backup_path = filepath.with_suffix('.yml.backup')
-            filepath.rename(backup_path)
-            logger.info(f"Created backup: {backup_path}")
-
-        # Write new data
-        with open(filepath, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
-
-        logger.info(f"Successfully saved to {filepath}")
-
-        # Remove backup on success
-        if backup_path.exists():
-            backup_path.unlink()
+        # Write to a temp file, then swap it in with one atomic rename;
+        # the existing file stays intact until the new one is complete
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            yaml.dump(data, f, Dumper=yaml_dumper, default_flow_style=False, allow_unicode=True)
 
+        os.replace(tmp_path, filepath)
+        logger.info("Successfully saved to %s", filepath)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to save {filename}: {e}")
+        logger.error("Failed to save %s: %s", filename, e)
 
-        # Restore backup if save failed
-        backup_path = filepath.with_suffix('.yml.backup')
-        if backup_path.exists():
-            backup_path.rename(filepath)
-            logger.info("Restored from backup")
+        # Drop the partial temp file; the original is untouched
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
 
         return False
 
 
-def fetch_ai_conferences() -> list:
+def _evict_yaml_cache() -> None:
+    """Drop the oldest sidecar entries beyond the cache limit."""
+    entries = sorted(YAML_CACHE_DIR.glob('*.json'), key=lambda p: p.stat().st_mtime)
+    for path in entries[:-YAML_CACHE_LIMIT]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def parse_yaml_cached(text):
+    """Parse a YAML document, short-circuiting via a JSON sidecar cache.
+
+    The cache key is a content hash, so unchanged documents skip the
+    YAML parser entirely and reload from JSON. Documents containing
+    non-JSON types (e.g. bare dates) are parsed normally and not cached.
+
+    Args:
+        text: YAML document as str or bytes
+
+    Returns:
+        Parsed YAML data
+    """
+    raw = text if isinstance(text, bytes) else text.encode('utf-8')
+    key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cache_path = YAML_CACHE_DIR / f'{key}.json'
+
+    try:
+        with open(cache_path, 'rb') as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        pass
+
+    # Drive the loader directly; yaml.load adds a wrapper layer on top
+    # of exactly this construct/parse/dispose sequence
+    _, yaml_loader, _ = _import_yaml()
+    loader = yaml_loader(text)
+    try:
+        data = loader.get_single_data()
+    finally:
+        loader.dispose()
+
+    try:
+        serialized = _json_dumps(data)
+    except (TypeError, ValueError):
+        return data
+
+    try:
+        YAML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(serialized)
+        _evict_yaml_cache()
+    except OSError as e:
+        logger.debug("Failed to write YAML cache entry: %s", e)
+
+    return data
+
+
+def _parse_yaml_worker(text):
+    """Parse one YAML document in a worker process.
+
+    Returns the parse error instead of raising so the caller can keep
+    per-conference failure tracking across the pool.
+    """
+    yaml, _, _ = _import_yaml()
+    try:
+        return parse_yaml_cached(text)
+    except yaml.YAMLError as e:
+        return e
+
+
+def _load_http_cache() -> dict:
+    """Load the conditional-GET cache, or an empty cache if unreadable."""
+    try:
+        with gzip.open(HTTP_CACHE_FILE, 'rb') as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_http_cache(cache: dict) -> None:
+    """Atomically persist the conditional-GET cache."""
+    tmp_path = HTTP_CACHE_FILE.with_suffix('.gz.tmp')
+    try:
+        tmp_path.write_bytes(gzip.compress(_json_dumps(cache), compresslevel=6))
+        tmp_path.replace(HTTP_CACHE_FILE)
+    except OSError as e:
+        logger.debug("Failed to write HTTP cache: %s", e)
+
+
+async def _fetch_conference_yaml(
+    client: 'httpx.AsyncClient',
+    url: str,
+    cached: dict = None,
+) -> dict:
+    """Fetch the YAML text for a single AI conference as a cache entry.
+
+    Sends the cached validators when available; a 304 response reuses
+    the cached text without downloading the body again.
+    """
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    response = await client.get(url, headers=headers)
+    if response.status_code == 304:
+        return cached
+    response.raise_for_status()
+    return {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'text': response.text,
+    }
+
+
+async def _fetch_with_retry(
+    client: 'httpx.AsyncClient',
+    url: str,
+    cached: dict,
+    sem: asyncio.Semaphore,
+    retries: int = 3,
+) -> dict:
+    """Fetch with bounded concurrency and exponential-backoff retries.
+
+    A transient network error or 5xx no longer drops the conference for
+    the whole run; only a persistent failure (or a 4xx) propagates.
+    """
+    import httpx
+
+    async with sem:
+        for attempt in range(retries):
+            try:
+                return await _fetch_conference_yaml(client, url, cached)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code < 500 or attempt == retries - 1:
+                    raise
+            except (httpx.TransportError, asyncio.TimeoutError):
+                if attempt == retries - 1:
+                    raise
+            await asyncio.sleep(0.3 * 2 ** attempt)
+
+
+async def fetch_ai_conferences() -> list:
     """
     Fetch all AI conferences from Hugging Face individual files.
 
+    The per-conference GETs all target the same host, so they are
+    multiplexed concurrently over a single HTTP/2 connection — one TLS
+    handshake and one congestion window for all of them.
+
     Returns:
         Consolidated list of AI conferences, or empty list on failure
     """
-    consolidated_conferences = []
+    import httpx
+
     failed_conferences = []
 
-    logger.info(f"Fetching {len(AI_CONFERENCE_NAMES)} AI conferences from Hugging Face")
+    logger.info("Fetching %d AI conferences from Hugging Face", len(AI_CONFERENCE_NAMES))
 
-    for conf_name in AI_CONFERENCE_NAMES:
-        url = f"{AI_CONFERENCES_BASE_URL}/{conf_name}.yml"
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            conf_data = yaml.safe_load(response.text)
+    cache = _load_http_cache()
 
-            # Add conference data to consolidated list
-            if isinstance(conf_data, dict):
-                consolidated_conferences.append(conf_data)
-            elif isinstance(conf_data, list):
-                consolidated_conferences.extend(conf_data)
+    # One connection is enough: HTTP/2 streams the requests in parallel,
+    # with the semaphore bounding how many are in flight at once
+    sem = asyncio.Semaphore(20)
+    limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=10) as client:
+        results = await asyncio.gather(
+            *(_fetch_with_retry(client, url, cache.get(name), sem)
+              for name, url in zip(AI_CONFERENCE_NAMES, AI_CONFERENCE_URLS)),
+            return_exceptions=True,
+        )
 
-        except requests.RequestException as e:
+    fetched = []
+    for conf_name, result in zip(AI_CONFERENCE_NAMES, results):
+        if isinstance(result, BaseException):
             failed_conferences.append(conf_name)
-            logger.debug(f"Failed to fetch {conf_name}: {e}")
-        except yaml.YAMLError as e:
+            logger.debug("Failed to fetch %s: %s", conf_name, result)
+            continue
+
+        cache[conf_name] = result
+        fetched.append((conf_name, result))
+
+    # Revalidated (304) entries carry their parsed document in the cache
+    # and skip YAML entirely; only new/changed texts go to the parsers
+    parsed_docs = [entry.get('data') for _, entry in fetched]
+    to_parse = [(i, entry['text'])
+                for i, (_, entry) in enumerate(fetched) if 'data' not in entry]
+
+    if to_parse:
+        # Each document parses independently, so spread the CPU-bound
+        # parse phase across cores once all responses are in. Workers
+        # are spawned rather than forked (main runs this alongside
+        # to_thread source updates, and forking with live threads can
+        # deadlock the children on mid-fork locks), and the pool is
+        # driven from a thread so the event loop keeps serving the
+        # other sources while the parse runs.
+        def _parse_in_pool() -> list:
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(mp_context=ctx) as executor:
+                return list(executor.map(
+                    _parse_yaml_worker, (text for _, text in to_parse), chunksize=8))
+
+        for (i, _), doc in zip(to_parse, await asyncio.to_thread(_parse_in_pool)):
+            parsed_docs[i] = doc
+
+    per_file_results = []
+    for (conf_name, entry), conf_data in zip(fetched, parsed_docs):
+        if isinstance(conf_data, Exception):
             failed_conferences.append(conf_name)
-            logger.debug(f"Failed to parse {conf_name}: {e}")
-
-    logger.info(f"Successfully fetched {len(consolidated_conferences)} AI conferences")
+            logger.debug("Failed to parse %s: %s", conf_name, conf_data)
+            continue
+
+        # Remember JSON-safe parses so a future 304 skips the parse too
+        if 'data' not in entry:
+            try:
+                _json_dumps(conf_data)
+            except (TypeError, ValueError):
+                pass
+            else:
+                entry['data'] = conf_data
+
+        # Normalize each file's contents to a list of conferences
+        if isinstance(conf_data, dict):
+            per_file_results.append([conf_data])
+        elif isinstance(conf_data, list):
+            per_file_results.append(conf_data)
+
+    # Flatten and dedupe in one O(N) pass: the dict keeps the last entry
+    # per (name, year) and preserves insertion order
+    consolidated_conferences = list({
+        (conf.get('title') or conf.get('name'), conf.get('year', str(conf.get('deadline')))): conf
+        for conf in chain.from_iterable(per_file_results)
+    }.values())
+
+    _save_http_cache(cache)
+
+    logger.info("Successfully fetched %d AI conferences", len(consolidated_conferences))
     if failed_conferences:
-        logger.warning(f"Failed to fetch {len(failed_conferences)} conferences: {', '.join(failed_conferences[:5])}{'...' if len(failed_conferences) > 5 else ''}")
+        logger.warning(
+            "Failed to fetch %d conferences: %s%s",
+            len(failed_conferences),
+            ', '.join(failed_conferences[:5]),
+            '...' if len(failed_conferences) > 5 else '',
+        )
 
     return consolidated_conferences
 
 
-def update_ai_conferences() -> bool:
+async def update_ai_conferences() -> bool:
     """
     Update AI conferences by fetching and consolidating individual files.
 
@@ -186,34 +501,34 @@ def update_ai_conferences() -> bool:
     filename = 'ai-conferences.yml'
 
     try:
-        logger.info(f"Updating {filename}")
+        logger.info("Updating %s", filename)
 
-        # Fetch all AI conferences
-        data = fetch_ai_conferences()
+        # Fetch all AI conferences concurrently
+        data = await fetch_ai_conferences()
 
         if not data:
-            logger.error(f"No AI conference data fetched, keeping existing data")
+            logger.error("No AI conference data fetched, keeping existing data")
             return False
 
         # Validate data
         if not validate_conference_data(data, filename):
-            logger.error(f"Validation failed for {filename}, keeping existing data")
+            logger.error("Validation failed for %s, keeping existing data", filename)
             return False
 
         # Save data
         if not save_conference_data(data, filename):
-            logger.error(f"Save failed for {filename}, keeping existing data")
+            logger.error("Save failed for %s, keeping existing data", filename)
             return False
 
         return True
 
     except Exception as e:
-        logger.error(f"Unexpected error updating {filename}: {e}")
+        logger.error("Unexpected error updating %s: %s", filename, e)
         logger.info("Keeping existing data")
         return False
 
 
-def update_single_source(filename: str, url: str) -> bool:
+async def update_single_source(filename: str, url: str) -> bool:
     """
     Update a single conference data source.
 
@@ -224,75 +539,90 @@ def update_single_source(filename: str, url: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    import requests
+    import yaml
+
     try:
-        # Fetch data
-        data = fetch_conference_data(url)
+        # Fetch data; the requests-based fetch is blocking, so run it on a
+        # worker thread to keep the event loop free for the AI fetches
+        data = await asyncio.to_thread(fetch_conference_data, url)
 
         # Validate data
         if not validate_conference_data(data, filename):
-            logger.error(f"Validation failed for {filename}, keeping existing data")
+            logger.error("Validation failed for %s, keeping existing data", filename)
             return False
 
         # Save data
         if not save_conference_data(data, filename):
-            logger.error(f"Save failed for {filename}, keeping existing data")
+            logger.error("Save failed for %s, keeping existing data", filename)
             return False
 
         return True
 
     except requests.RequestException as e:
-        logger.error(f"Network error fetching {filename}: {e}")
+        logger.error("Network error fetching %s: %s", filename, e)
         logger.info("Keeping existing data")
         return False
 
     except yaml.YAMLError as e:
-        logger.error(f"YAML parse error for {filename}: {e}")
+        logger.error("YAML parse error for %s: %s", filename, e)
         logger.info("Keeping existing data")
         return False
 
     except Exception as e:
-        logger.error(f"Unexpected error updating {filename}: {e}")
+        logger.error("Unexpected error updating %s: %s", filename, e)
         logger.info("Keeping existing data")
         return False
 
 
+async def _update_all_sources() -> list:
+    """Run the AI consolidation and every single-source update concurrently.
+
+    Returns one result per source (True/False, or the exception if an
+    update raised) in the order: AI conferences, then SOURCES.
+    """
+    return await asyncio.gather(
+        update_ai_conferences(),
+        *(update_single_source(filename, url) for filename, url in SOURCES.items()),
+        return_exceptions=True,
+    )
+
+
 def main():
     """Main function to update all conference data sources."""
     logger.info("Starting conference data update")
 
+    _enable_dns_cache()
+
     # Ensure data directory exists
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    success_count = 0
     total_count = len(SOURCES) + 1  # +1 for AI conferences
 
-    # Update AI conferences
-    logger.info(f"\n{'='*60}")
-    logger.info(f"Updating ai-conferences.yml")
-    logger.info(f"{'='*60}")
+    # The sources are independent and I/O-bound, so update them all
+    # concurrently instead of one after the other
+    filenames = ['ai-conferences.yml', *SOURCES]
 
-    if update_ai_conferences():
-        success_count += 1
-        logger.info(f"✓ ai-conferences.yml updated successfully")
-    else:
-        logger.warning(f"✗ ai-conferences.yml update failed")
+    logger.info("\n%s", _BANNER)
+    logger.info("Updating %d sources concurrently", total_count)
+    logger.info(_BANNER)
 
-    # Update other sources
-    for filename, url in SOURCES.items():
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Updating {filename}")
-        logger.info(f"{'='*60}")
+    results = asyncio.run(_update_all_sources())
 
-        if update_single_source(filename, url):
+    success_count = 0
+    for filename, result in zip(filenames, results):
+        if result is True:
             success_count += 1
-            logger.info(f"✓ {filename} updated successfully")
+            logger.info("✓ %s updated successfully", filename)
         else:
-            logger.warning(f"✗ {filename} update failed")
+            if isinstance(result, BaseException):
+                logger.error("Unexpected error updating %s: %s", filename, result)
+            logger.warning("✗ %s update failed", filename)
 
     # Summary
-    logger.info(f"\n{'='*60}")
-    logger.info(f"Update complete: {success_count}/{total_count} sources updated")
-    logger.info(f"{'='*60}")
+    logger.info("\n%s", _BANNER)
+    logger.info("Update complete: %d/%d sources updated", success_count, total_count)
+    logger.info(_BANNER)
 
     # Exit with appropriate code
     if success_count == 0: